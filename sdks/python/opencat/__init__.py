@@ -1,4 +1,4 @@
-from .client import OpenCatClient, OpenCatError
+from .client import OpenCatAsyncClient, OpenCatClient, OpenCatError, use_isal
 from .models import (
     App,
     Entitlement,
@@ -12,6 +12,7 @@ from .models import (
 )
 
 __all__ = [
+    "OpenCatAsyncClient",
     "OpenCatClient",
     "OpenCatError",
     "App",
@@ -23,4 +24,5 @@ __all__ = [
     "SubscriberInfo",
     "Transaction",
     "WebhookEndpoint",
+    "use_isal",
 ]
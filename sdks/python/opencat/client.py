@@ -1,8 +1,21 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+import asyncio
+from functools import lru_cache
+from typing import Any, AsyncIterator, Iterator, Optional, Type, TypeVar
 
 import httpx
+import msgspec
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    from isal import isal_zlib as _isal_zlib
+except ImportError:  # pragma: no cover - optional speedup
+    _isal_zlib = None
 
 from .models import (
     App,
@@ -10,18 +23,134 @@ from .models import (
     Event,
     Product,
     SubscriberInfo,
-    Subscriber,
-    EntitlementInfo,
     Transaction,
     WebhookEndpoint,
 )
 
+T = TypeVar("T")
+
+
+def use_isal() -> bool:
+    """Route httpx response decompression through isal's SIMD zlib.
+
+    isal_zlib is a drop-in for stdlib zlib, typically 2-3x faster at
+    inflating the gzip bodies large list endpoints return. httpx's content
+    decoders resolve zlib through their module global, so the swap affects
+    every httpx client in the process — which is why this is an explicit
+    call rather than an import side effect. Returns True if isal is
+    installed and the swap was applied, False otherwise.
+    """
+    if _isal_zlib is None:
+        return False
+    import httpx._decoders
+
+    httpx._decoders.zlib = _isal_zlib
+    return True
+
+
+# Long-running jobs tend to hit the same app_id/app_user_id over and over;
+# memoizing the formatted paths turns the f-string build into a dict lookup.
+
+
+@lru_cache(maxsize=1024)
+def _subscriber_path(app_user_id: str) -> str:
+    return f"/v1/subscribers/{app_user_id}"
+
+
+@lru_cache(maxsize=1024)
+def _products_path(app_id: str) -> str:
+    return f"/v1/apps/{app_id}/products"
+
+
+@lru_cache(maxsize=1024)
+def _entitlements_path(app_id: str) -> str:
+    return f"/v1/apps/{app_id}/entitlements"
+
+
+_DECODERS: dict[Any, msgspec.json.Decoder] = {}
+
+
+def _decoder(type_: Type[T]) -> msgspec.json.Decoder:
+    """Return a cached msgspec Decoder for a response type.
+
+    Building a Decoder walks the type annotations; doing it once per type
+    amortizes that reflection across every call and client instance.
+    """
+    try:
+        return _DECODERS[type_]
+    except KeyError:
+        dec = _DECODERS[type_] = msgspec.json.Decoder(type_)
+        return dec
+
+
+def _encode_json_body(kwargs: dict[str, Any]) -> None:
+    """Serialize a ``json=`` kwarg with orjson and pass it as raw content,
+    bypassing httpx's slower stdlib-json encode path."""
+    if orjson is not None and "json" in kwargs:
+        kwargs["content"] = orjson.dumps(kwargs.pop("json"))
+        kwargs.setdefault("headers", {})["Content-Type"] = "application/json"
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# get_subscriber is the single hottest call; bind its decoder once at import.
+_SUBSCRIBER_DECODER = msgspec.json.Decoder(SubscriberInfo)
+
+# Request bodies as structs: the shared encoder serializes them straight from
+# slots in C, skipping the per-call dict build that httpx would then encode.
+_ENCODER = msgspec.json.Encoder()
+
+
+class _AppReq(msgspec.Struct):
+    name: str
+    platform: str
+    bundle_id: str
+
+
+class _ProductReq(msgspec.Struct):
+    store_product_id: str
+    product_type: str
+    entitlement_ids: list[str]
+
+
+class _EntitlementReq(msgspec.Struct, omit_defaults=True):
+    name: str
+    description: Optional[str] = None
+
+
+class _ReceiptReq(msgspec.Struct):
+    app_id: str
+    app_user_id: str
+    store: str
+    receipt_data: str
+    product_id: str
+
+
+class _WebhookReq(msgspec.Struct, omit_defaults=True):
+    app_id: str
+    url: str
+    secret: Optional[str] = None
+
+
+def _raise_for_response(resp: httpx.Response) -> None:
+    # Decode at most 512 bytes of the error body ourselves instead of going
+    # through resp.text, which charset-sniffs the whole payload even when the
+    # caller only ever looks at the status code.
+    raise OpenCatError(resp.status_code, resp.content[:512].decode("utf-8", "replace"))
+
 
 class OpenCatError(Exception):
+    __slots__ = ("status_code", "detail")
+
     def __init__(self, status_code: int, detail: str):
         self.status_code = status_code
         self.detail = detail
-        super().__init__(f"HTTP {status_code}: {detail}")
+        super().__init__(status_code, detail)
+
+    def __str__(self) -> str:
+        # Format lazily: retry loops that only read .status_code shouldn't
+        # pay for building a message they never render.
+        return f"HTTP {self.status_code}: {self.detail}"
 
 
 class OpenCatClient:
@@ -29,9 +158,27 @@ class OpenCatClient:
         self._base = server_url.rstrip("/")
         self._client = httpx.Client(
             base_url=self._base,
-            headers={"Authorization": f"Bearer {api_key}"},
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=85.0,
+            ),
+            headers={
+                # Pre-encoded bytes pass through httpx's header normalization
+                # untouched instead of being re-encoded on every request.
+                b"Authorization": f"Bearer {api_key}".encode("ascii"),
+                b"Accept-Encoding": b"gzip",
+            },
             timeout=30.0,
+            default_encoding="utf-8",
         )
+        # Pre-parsed absolute URLs for the static endpoints; passing these
+        # skips httpx's per-request base_url join and normalization.
+        self._url_apps = httpx.URL(self._base + "/v1/apps")
+        self._url_webhooks = httpx.URL(self._base + "/v1/webhooks")
+        self._url_events = httpx.URL(self._base + "/v1/events")
+        self._url_receipts = httpx.URL(self._base + "/v1/receipts")
 
     def close(self) -> None:
         self._client.close()
@@ -44,36 +191,38 @@ class OpenCatClient:
 
     # -- helpers --
 
-    def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+    def _request_typed(self, method: str, path: "str | httpx.URL", type_: Type[T], **kwargs: Any) -> T:
+        _encode_json_body(kwargs)
         resp = self._client.request(method, path, **kwargs)
         if resp.status_code >= 400:
-            raise OpenCatError(resp.status_code, resp.text)
-        if resp.status_code == 204:
-            return None
-        return resp.json()
+            _raise_for_response(resp)
+        return _decoder(type_).decode(resp.content)
 
     # -- apps --
 
     def create_app(self, name: str, platform: str, bundle_id: str) -> App:
-        data = self._request("POST", "/v1/apps", json={
-            "name": name,
-            "platform": platform,
-            "bundle_id": bundle_id,
-        })
-        return App(**data)
+        return self._request_typed(
+            "POST",
+            self._url_apps,
+            App,
+            content=_ENCODER.encode(_AppReq(name, platform, bundle_id)),
+            headers=_JSON_HEADERS,
+        )
 
     def list_apps(self) -> list[App]:
-        data = self._request("GET", "/v1/apps")
-        return [App(**a) for a in data]
+        return self._request_typed("GET", self._url_apps, list[App])
 
     # -- subscribers --
 
     def get_subscriber(self, app_user_id: str) -> SubscriberInfo:
-        data = self._request("GET", f"/v1/subscribers/{app_user_id}")
-        sub = Subscriber(**data["subscriber"])
-        entitlements = [EntitlementInfo(**e) for e in data.get("active_entitlements", [])]
-        transactions = [Transaction(**t) for t in data.get("transactions", [])]
-        return SubscriberInfo(subscriber=sub, active_entitlements=entitlements, transactions=transactions)
+        # Dedicated hot path: hit the transport and the pre-bound decoder
+        # directly, skipping the generic helper's kwargs handling. The typed
+        # decode builds the whole Subscriber/EntitlementInfo/Transaction
+        # graph in one pass over the response bytes.
+        resp = self._client.request("GET", _subscriber_path(app_user_id))
+        if resp.status_code >= 400:
+            _raise_for_response(resp)
+        return _SUBSCRIBER_DECODER.decode(resp.content)
 
     # -- products --
 
@@ -84,31 +233,34 @@ class OpenCatClient:
         product_type: str,
         entitlement_ids: list[str],
     ) -> Product:
-        data = self._request("POST", f"/v1/apps/{app_id}/products", json={
-            "store_product_id": store_product_id,
-            "product_type": product_type,
-            "entitlement_ids": entitlement_ids,
-        })
-        return Product(**data)
+        return self._request_typed(
+            "POST",
+            _products_path(app_id),
+            Product,
+            content=_ENCODER.encode(
+                _ProductReq(store_product_id, product_type, entitlement_ids)
+            ),
+            headers=_JSON_HEADERS,
+        )
 
     def list_products(self, app_id: str) -> list[Product]:
-        data = self._request("GET", f"/v1/apps/{app_id}/products")
-        return [Product(**p) for p in data]
+        return self._request_typed("GET", _products_path(app_id), list[Product])
 
     # -- entitlements --
 
     def create_entitlement(
         self, app_id: str, name: str, description: Optional[str] = None
     ) -> Entitlement:
-        body: dict[str, Any] = {"name": name}
-        if description is not None:
-            body["description"] = description
-        data = self._request("POST", f"/v1/apps/{app_id}/entitlements", json=body)
-        return Entitlement(**data)
+        return self._request_typed(
+            "POST",
+            _entitlements_path(app_id),
+            Entitlement,
+            content=_ENCODER.encode(_EntitlementReq(name, description)),
+            headers=_JSON_HEADERS,
+        )
 
     def list_entitlements(self, app_id: str) -> list[Entitlement]:
-        data = self._request("GET", f"/v1/apps/{app_id}/entitlements")
-        return [Entitlement(**e) for e in data]
+        return self._request_typed("GET", _entitlements_path(app_id), list[Entitlement])
 
     # -- receipts --
 
@@ -120,27 +272,76 @@ class OpenCatClient:
         receipt_data: str,
         product_id: str,
     ) -> Transaction:
-        data = self._request("POST", "/v1/receipts", json={
-            "app_id": app_id,
-            "app_user_id": app_user_id,
-            "store": store,
-            "receipt_data": receipt_data,
-            "product_id": product_id,
-        })
-        return Transaction(**data)
+        return self._request_typed(
+            "POST",
+            self._url_receipts,
+            Transaction,
+            content=_ENCODER.encode(
+                _ReceiptReq(app_id, app_user_id, store, receipt_data, product_id)
+            ),
+            headers=_JSON_HEADERS,
+        )
+
+    def submit_receipts(
+        self, receipts: list[dict[str, Any]]
+    ) -> list[Transaction]:
+        """Submit many receipts concurrently.
+
+        Each item is a dict with the keys submit_receipt takes (app_id,
+        app_user_id, store, receipt_data, product_id). The requests are
+        pipelined over an async client, so N submissions cost roughly one
+        round trip instead of N.
+        """
+        return asyncio.run(self._bulk_post(self._url_receipts, receipts, Transaction))
+
+    def create_products(
+        self, app_id: str, products: list[dict[str, Any]]
+    ) -> list[Product]:
+        """Create many products under one app concurrently.
+
+        Each item is a dict with the keys create_product takes after app_id
+        (store_product_id, product_type, entitlement_ids).
+        """
+        url = httpx.URL(self._base + _products_path(app_id))
+        return asyncio.run(self._bulk_post(url, products, Product))
+
+    async def _bulk_post(
+        self, url: httpx.URL, bodies: list[dict[str, Any]], type_: Type[T]
+    ) -> list[T]:
+        dec = _decoder(type_)
+        async with httpx.AsyncClient(
+            http2=True,
+            headers=self._client.headers,
+            timeout=30.0,
+            default_encoding="utf-8",
+        ) as client:
+
+            async def post(body: dict[str, Any]) -> httpx.Response:
+                kwargs: dict[str, Any] = {"json": body}
+                _encode_json_body(kwargs)
+                return await client.post(url, **kwargs)
+
+            resps = await asyncio.gather(*[post(b) for b in bodies])
+        results: list[T] = []
+        for resp in resps:
+            if resp.status_code >= 400:
+                _raise_for_response(resp)
+            results.append(dec.decode(resp.content))
+        return results
 
     # -- webhooks --
 
     def create_webhook(self, app_id: str, url: str, secret: Optional[str] = None) -> WebhookEndpoint:
-        body: dict[str, Any] = {"app_id": app_id, "url": url}
-        if secret is not None:
-            body["secret"] = secret
-        data = self._request("POST", "/v1/webhooks", json=body)
-        return WebhookEndpoint(**data)
+        return self._request_typed(
+            "POST",
+            self._url_webhooks,
+            WebhookEndpoint,
+            content=_ENCODER.encode(_WebhookReq(app_id, url, secret)),
+            headers=_JSON_HEADERS,
+        )
 
     def list_webhooks(self) -> list[WebhookEndpoint]:
-        data = self._request("GET", "/v1/webhooks")
-        return [WebhookEndpoint(**w) for w in data]
+        return self._request_typed("GET", self._url_webhooks, list[WebhookEndpoint])
 
     # -- events --
 
@@ -148,5 +349,203 @@ class OpenCatClient:
         params: dict[str, str] = {}
         if cursor is not None:
             params["since"] = cursor
-        data = self._request("GET", "/v1/events", params=params)
-        return [Event(**e) for e in data]
+        return self._request_typed("GET", self._url_events, list[Event], params=params)
+
+    def iter_events(self, cursor: Optional[str] = None) -> Iterator[Event]:
+        """Stream events one at a time from an NDJSON response.
+
+        Each line is decoded into an Event as it arrives, so memory stays
+        constant regardless of page size and parsing overlaps with network
+        I/O instead of waiting for the full body.
+        """
+        params: dict[str, str] = {}
+        if cursor is not None:
+            params["since"] = cursor
+        dec = _decoder(Event)
+        with self._client.stream(
+            "GET",
+            self._url_events,
+            params=params,
+            headers={"Accept": "application/x-ndjson"},
+        ) as resp:
+            if resp.status_code >= 400:
+                resp.read()
+                _raise_for_response(resp)
+            for line in resp.iter_lines():
+                if line:
+                    yield dec.decode(line)
+
+
+class OpenCatAsyncClient:
+    """Async twin of OpenCatClient, backed by httpx.AsyncClient.
+
+    Useful for overlapping I/O-bound work such as paginating list_events
+    or fanning requests out across apps with asyncio.gather.
+    """
+
+    def __init__(self, server_url: str, api_key: str):
+        self._base = server_url.rstrip("/")
+        self._client = httpx.AsyncClient(
+            base_url=self._base,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=85.0,
+            ),
+            headers={
+                # Pre-encoded bytes pass through httpx's header normalization
+                # untouched instead of being re-encoded on every request.
+                b"Authorization": f"Bearer {api_key}".encode("ascii"),
+                b"Accept-Encoding": b"gzip",
+            },
+            timeout=30.0,
+            default_encoding="utf-8",
+        )
+        # Pre-parsed absolute URLs for the static endpoints; passing these
+        # skips httpx's per-request base_url join and normalization.
+        self._url_apps = httpx.URL(self._base + "/v1/apps")
+        self._url_webhooks = httpx.URL(self._base + "/v1/webhooks")
+        self._url_events = httpx.URL(self._base + "/v1/events")
+        self._url_receipts = httpx.URL(self._base + "/v1/receipts")
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args: Any):
+        await self.aclose()
+
+    # -- helpers --
+
+    async def _request_typed(self, method: str, path: "str | httpx.URL", type_: Type[T], **kwargs: Any) -> T:
+        _encode_json_body(kwargs)
+        resp = await self._client.request(method, path, **kwargs)
+        if resp.status_code >= 400:
+            _raise_for_response(resp)
+        return _decoder(type_).decode(resp.content)
+
+    # -- apps --
+
+    async def create_app(self, name: str, platform: str, bundle_id: str) -> App:
+        return await self._request_typed(
+            "POST",
+            self._url_apps,
+            App,
+            content=_ENCODER.encode(_AppReq(name, platform, bundle_id)),
+            headers=_JSON_HEADERS,
+        )
+
+    async def list_apps(self) -> list[App]:
+        return await self._request_typed("GET", self._url_apps, list[App])
+
+    # -- subscribers --
+
+    async def get_subscriber(self, app_user_id: str) -> SubscriberInfo:
+        resp = await self._client.request("GET", _subscriber_path(app_user_id))
+        if resp.status_code >= 400:
+            _raise_for_response(resp)
+        return _SUBSCRIBER_DECODER.decode(resp.content)
+
+    # -- products --
+
+    async def create_product(
+        self,
+        app_id: str,
+        store_product_id: str,
+        product_type: str,
+        entitlement_ids: list[str],
+    ) -> Product:
+        return await self._request_typed(
+            "POST",
+            _products_path(app_id),
+            Product,
+            content=_ENCODER.encode(
+                _ProductReq(store_product_id, product_type, entitlement_ids)
+            ),
+            headers=_JSON_HEADERS,
+        )
+
+    async def list_products(self, app_id: str) -> list[Product]:
+        return await self._request_typed("GET", _products_path(app_id), list[Product])
+
+    # -- entitlements --
+
+    async def create_entitlement(
+        self, app_id: str, name: str, description: Optional[str] = None
+    ) -> Entitlement:
+        return await self._request_typed(
+            "POST",
+            _entitlements_path(app_id),
+            Entitlement,
+            content=_ENCODER.encode(_EntitlementReq(name, description)),
+            headers=_JSON_HEADERS,
+        )
+
+    async def list_entitlements(self, app_id: str) -> list[Entitlement]:
+        return await self._request_typed("GET", _entitlements_path(app_id), list[Entitlement])
+
+    # -- receipts --
+
+    async def submit_receipt(
+        self,
+        app_id: str,
+        app_user_id: str,
+        store: str,
+        receipt_data: str,
+        product_id: str,
+    ) -> Transaction:
+        return await self._request_typed(
+            "POST",
+            self._url_receipts,
+            Transaction,
+            content=_ENCODER.encode(
+                _ReceiptReq(app_id, app_user_id, store, receipt_data, product_id)
+            ),
+            headers=_JSON_HEADERS,
+        )
+
+    # -- webhooks --
+
+    async def create_webhook(self, app_id: str, url: str, secret: Optional[str] = None) -> WebhookEndpoint:
+        return await self._request_typed(
+            "POST",
+            self._url_webhooks,
+            WebhookEndpoint,
+            content=_ENCODER.encode(_WebhookReq(app_id, url, secret)),
+            headers=_JSON_HEADERS,
+        )
+
+    async def list_webhooks(self) -> list[WebhookEndpoint]:
+        return await self._request_typed("GET", self._url_webhooks, list[WebhookEndpoint])
+
+    # -- events --
+
+    async def list_events(self, cursor: Optional[str] = None) -> list[Event]:
+        params: dict[str, str] = {}
+        if cursor is not None:
+            params["since"] = cursor
+        return await self._request_typed("GET", self._url_events, list[Event], params=params)
+
+    async def iter_events(self, cursor: Optional[str] = None) -> AsyncIterator[Event]:
+        """Yield events page by page, pre-fetching the next page while the
+        caller consumes the current one."""
+        page = await self.list_events(cursor)
+        while page:
+            next_page = asyncio.create_task(self.list_events(page[-1].id))
+            try:
+                for event in page:
+                    yield event
+            except BaseException:
+                # The consumer bailed mid-page (break, aclose, cancellation):
+                # reap the prefetch task so it doesn't outlive the generator
+                # and blow up once the client is closed.
+                next_page.cancel()
+                try:
+                    await next_page
+                except BaseException:
+                    pass
+                raise
+            page = await next_page
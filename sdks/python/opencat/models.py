@@ -1,10 +1,16 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
+
 from typing import Optional
 
+import msgspec
+
+# All models are msgspec Structs, which define __slots__ and carry no
+# per-instance __dict__: attributes live in a fixed array on the instance,
+# halving memory per object versus a plain dataclass and speeding up both
+# construction and attribute access on hot paths like get_subscriber.
 
-@dataclass
-class App:
+
+class App(msgspec.Struct):
     id: str
     name: str
     platform: str
@@ -14,16 +20,14 @@ class App:
     store_credentials_encrypted: Optional[str] = None
 
 
-@dataclass
-class Subscriber:
+class Subscriber(msgspec.Struct):
     id: str
     app_id: str
     app_user_id: str
     created_at: str
 
 
-@dataclass
-class EntitlementInfo:
+class EntitlementInfo(msgspec.Struct):
     id: str
     is_active: bool
     product_id: str
@@ -33,15 +37,29 @@ class EntitlementInfo:
     purchase_date: Optional[str] = None
 
 
-@dataclass
-class SubscriberInfo:
+class Transaction(msgspec.Struct):
+    id: str
+    subscriber_id: str
+    product_id: str
+    store: str
+    store_transaction_id: str
+    purchase_date: str
+    status: str
+    created_at: str
+    updated_at: str
+    expiration_date: Optional[str] = None
+    # Kept as raw JSON bytes: receipts can be large and most callers never
+    # look at them. Decode on demand with msgspec.json.decode(raw_receipt).
+    raw_receipt: Optional[msgspec.Raw] = None
+
+
+class SubscriberInfo(msgspec.Struct):
     subscriber: Subscriber
-    active_entitlements: list[EntitlementInfo] = field(default_factory=list)
-    transactions: list[Transaction] = field(default_factory=list)
+    active_entitlements: list[EntitlementInfo] = []
+    transactions: list[Transaction] = []
 
 
-@dataclass
-class Entitlement:
+class Entitlement(msgspec.Struct):
     id: str
     app_id: str
     name: str
@@ -49,8 +67,7 @@ class Entitlement:
     description: Optional[str] = None
 
 
-@dataclass
-class Product:
+class Product(msgspec.Struct):
     id: str
     app_id: str
     store_product_id: str
@@ -58,23 +75,7 @@ class Product:
     created_at: str
 
 
-@dataclass
-class Transaction:
-    id: str
-    subscriber_id: str
-    product_id: str
-    store: str
-    store_transaction_id: str
-    purchase_date: str
-    status: str
-    created_at: str
-    updated_at: str
-    expiration_date: Optional[str] = None
-    raw_receipt: Optional[str] = None
-
-
-@dataclass
-class WebhookEndpoint:
+class WebhookEndpoint(msgspec.Struct):
     id: str
     app_id: str
     url: str
@@ -83,10 +84,12 @@ class WebhookEndpoint:
     created_at: str
 
 
-@dataclass
-class Event:
+class Event(msgspec.Struct):
     id: str
     subscriber_id: str
     event_type: str
-    payload: str
+    # Raw JSON bytes, skipping the per-row str allocation for a field that
+    # is only inspected selectively. Decode with msgspec.json.decode(payload).
+    payload: msgspec.Raw
     created_at: str
+
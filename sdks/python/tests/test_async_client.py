@@ -0,0 +1,99 @@
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from opencat import OpenCatAsyncClient, OpenCatError
+
+
+BASE = "https://api.example.com"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_list_apps():
+    respx.get(f"{BASE}/v1/apps").mock(return_value=httpx.Response(200, json=[
+        {"id": "app-1", "name": "A", "platform": "ios", "bundle_id": "com.a",
+         "created_at": "t", "updated_at": "t"},
+    ]))
+    async with OpenCatAsyncClient(BASE, "test-key") as client:
+        apps = await client.list_apps()
+    assert len(apps) == 1
+    assert apps[0].id == "app-1"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_submit_receipt():
+    respx.post(f"{BASE}/v1/receipts").mock(return_value=httpx.Response(200, json={
+        "id": "tx1", "subscriber_id": "s1", "product_id": "p1",
+        "store": "apple", "store_transaction_id": "abc",
+        "purchase_date": "t", "status": "active",
+        "created_at": "t", "updated_at": "t",
+    }))
+    async with OpenCatAsyncClient(BASE, "test-key") as client:
+        tx = await client.submit_receipt("app-1", "user-1", "apple", "receipt-data", "p1")
+    assert tx.status == "active"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_iter_events_paginates():
+    def page(request):
+        since = request.url.params.get("since")
+        if since is None:
+            events = [
+                {"id": "ev1", "subscriber_id": "s1", "event_type": "purchase",
+                 "payload": "{}", "created_at": "t"},
+                {"id": "ev2", "subscriber_id": "s1", "event_type": "renewal",
+                 "payload": "{}", "created_at": "t"},
+            ]
+        elif since == "ev2":
+            events = [
+                {"id": "ev3", "subscriber_id": "s2", "event_type": "purchase",
+                 "payload": "{}", "created_at": "t"},
+            ]
+        else:
+            events = []
+        return httpx.Response(200, json=events)
+
+    respx.get(f"{BASE}/v1/events").mock(side_effect=page)
+    async with OpenCatAsyncClient(BASE, "test-key") as client:
+        seen = [event.id async for event in client.iter_events()]
+    assert seen == ["ev1", "ev2", "ev3"]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_iter_events_early_exit_cancels_prefetch():
+    def page(request):
+        if request.url.params.get("since") is None:
+            events = [
+                {"id": "ev1", "subscriber_id": "s1", "event_type": "purchase",
+                 "payload": "{}", "created_at": "t"},
+            ]
+        else:
+            events = []
+        return httpx.Response(200, json=events)
+
+    respx.get(f"{BASE}/v1/events").mock(side_effect=page)
+    async with OpenCatAsyncClient(BASE, "test-key") as client:
+        agen = client.iter_events()
+        async for event in agen:
+            assert event.id == "ev1"
+            break
+        await agen.aclose()
+        # the in-flight prefetch must not outlive the generator
+        stray = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        assert stray == []
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_error_handling():
+    respx.get(f"{BASE}/v1/apps").mock(return_value=httpx.Response(401, text="Unauthorized"))
+    async with OpenCatAsyncClient(BASE, "test-key") as client:
+        with pytest.raises(OpenCatError) as exc_info:
+            await client.list_apps()
+    assert exc_info.value.status_code == 401
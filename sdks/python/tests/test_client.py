@@ -81,6 +81,27 @@ def test_submit_receipt(client):
     assert tx.status == "active"
 
 
+@respx.mock
+def test_submit_receipts_bulk(client):
+    def respond(request):
+        body = json.loads(request.content)
+        return httpx.Response(200, json={
+            "id": f"tx-{body['app_user_id']}", "subscriber_id": "s1",
+            "product_id": body["product_id"], "store": body["store"],
+            "store_transaction_id": "abc", "purchase_date": "t",
+            "status": "active", "created_at": "t", "updated_at": "t",
+        })
+
+    respx.post(f"{BASE}/v1/receipts").mock(side_effect=respond)
+    txs = client.submit_receipts([
+        {"app_id": "app-1", "app_user_id": "u1", "store": "apple",
+         "receipt_data": "r1", "product_id": "p1"},
+        {"app_id": "app-1", "app_user_id": "u2", "store": "apple",
+         "receipt_data": "r2", "product_id": "p1"},
+    ])
+    assert [tx.id for tx in txs] == ["tx-u1", "tx-u2"]
+
+
 @respx.mock
 def test_create_webhook(client):
     respx.post(f"{BASE}/v1/webhooks").mock(return_value=httpx.Response(200, json={
@@ -99,6 +120,24 @@ def test_list_events(client):
     ]))
     events = client.list_events()
     assert len(events) == 1
+    # payload stays raw JSON bytes until explicitly decoded
+    assert json.loads(bytes(events[0].payload)) == "{}"
+
+
+@respx.mock
+def test_iter_events_streams_ndjson(client):
+    lines = (
+        '{"id": "ev1", "subscriber_id": "s1", "event_type": "purchase",'
+        ' "payload": "{}", "created_at": "t"}\n'
+        '{"id": "ev2", "subscriber_id": "s2", "event_type": "renewal",'
+        ' "payload": "{}", "created_at": "t"}\n'
+    )
+    respx.get(f"{BASE}/v1/events").mock(return_value=httpx.Response(
+        200, text=lines, headers={"Content-Type": "application/x-ndjson"},
+    ))
+    events = list(client.iter_events())
+    assert [e.id for e in events] == ["ev1", "ev2"]
+    assert events[1].event_type == "renewal"
 
 
 @respx.mock
@@ -109,6 +148,24 @@ def test_error_handling(client):
     assert exc_info.value.status_code == 401
 
 
+def test_use_isal_is_opt_in():
+    import zlib
+
+    import httpx._decoders
+
+    import opencat
+
+    # importing the SDK must not swap httpx's zlib behind anyone's back
+    assert httpx._decoders.zlib is zlib
+    try:
+        if opencat.use_isal():
+            from isal import isal_zlib
+
+            assert httpx._decoders.zlib is isal_zlib
+    finally:
+        httpx._decoders.zlib = zlib
+
+
 @respx.mock
 def test_auth_header(client):
     route = respx.get(f"{BASE}/v1/apps").mock(return_value=httpx.Response(200, json=[]))